@@ -2,7 +2,7 @@
 Gold Tier Audit Logger – JSON-per-action logging to /Logs + Neon DB.
 
 Every MCP tool call, agent decision, and error is logged as:
-  1. A separate JSON file in /Logs (always)
+  1. A line in the daily append-only JSONL file in /Logs (always)
   2. A row in the Neon DB 'events' table (if DATABASE_URL is set)
 
 Never crashes on logging failures — falls back to stdout.
@@ -10,14 +10,75 @@ Never crashes on logging failures — falls back to stdout.
 
 from __future__ import annotations
 
-import json
+import atexit
+import os
+import queue
+import threading
+import time
 import uuid
 from pathlib import Path
 from datetime import datetime, timezone
 
+from utils.jsonio import dumps as _dumps, dumps_bytes as _dumps_bytes
+
 BASE_DIR = Path(__file__).resolve().parent
 LOGS_DIR = BASE_DIR / "Logs"
 
+
+# DB events are queued and committed in batches by a background thread
+# (one transaction per batch instead of one commit per event). Large
+# batches — e.g. the final drain of a busy run — go through COPY FROM
+# STDIN instead of multi-row INSERT.
+_BATCH_SIZE = 500
+_BATCH_TIMEOUT = 0.25  # seconds to wait for more events before committing
+_COPY_MIN_ROWS = 100
+
+# Bounded so a stalled worker can never grow the queue without limit; at
+# the cap the caller falls back to stdout instead of blocking.
+_QUEUE_MAX = 10_000
+_event_queue: queue.Queue[dict] = queue.Queue(maxsize=_QUEUE_MAX)
+_worker_lock = threading.Lock()
+_worker_started = False
+
+# Daily JSONL log, written by the worker thread as one O_APPEND write(2)
+# per drained batch (coalesced syscalls; io_uring-style batching without a
+# liburing dependency). Rolled at midnight UTC.
+_log_fd: int | None = None
+_log_name: str | None = None
+_log_buf = bytearray()  # reused per batch in the worker; avoids per-event alloc
+
+
+def _current_log_name() -> str:
+    return f"run_{datetime.now(timezone.utc).strftime('%Y%m%d')}.jsonl"
+
+
+def _get_log_fd() -> int:
+    """Return the O_APPEND fd for today's JSONL log, rolling at midnight UTC."""
+    global _log_fd, _log_name
+    name = _current_log_name()
+    if _log_fd is None or _log_name != name:
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        if _log_fd is not None:
+            os.close(_log_fd)
+        _log_fd = os.open(LOGS_DIR / name, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        _log_name = name
+    return _log_fd
+
+
+def _write_lines(batch: list[dict]) -> None:
+    """Append all serialized lines of a batch in a single write syscall."""
+    try:
+        fd = _get_log_fd()
+        _log_buf.clear()
+        for item in batch:
+            _log_buf.extend(item["line"])
+            _log_buf.extend(b"\n")
+        os.write(fd, _log_buf)
+    except Exception:
+        for item in batch:
+            print(f"[AUDIT FALLBACK] {item['line'].decode('utf-8', 'replace')}")
+
+
 # ---- DB integration (optional) ----
 _db_ok = False
 _SessionLocal = None
@@ -47,15 +108,122 @@ def get_db_event_count() -> int:
     """Return how many events were written for the current run_id."""
     if not _db_ok or _SessionLocal is None or _current_run_id is None:
         return 0
+    try:
+        # Flat SELECT COUNT(*) — Query.count() wraps it in a subquery
+        from sqlalchemy import func, select
+
+        with _SessionLocal() as session:
+            stmt = (
+                select(func.count())
+                .select_from(_Event)
+                .where(_Event.run_id == _current_run_id)
+            )
+            return session.execute(stmt).scalar_one()
+    except Exception:
+        return 0
+
+
+def _ensure_worker() -> None:
+    """Start the DB writer thread on first use (daemon, never blocks exit)."""
+    global _worker_started
+    if _worker_started:
+        return
+    with _worker_lock:
+        if not _worker_started:
+            thread = threading.Thread(target=_drain_loop, name="audit-db-writer", daemon=True)
+            thread.start()
+            _worker_started = True
+
+
+def _copy_batch(mappings: list[dict]) -> bool:
+    """Bulk-load event rows with COPY FROM STDIN. Returns True on success.
+
+    Uses psycopg2's copy_expert through a raw connection; CSV format so the
+    driver handles quoting, unquoted empty fields read as NULL (run_id on
+    pre-run events), and the omitted ts column takes its server default.
+    """
+    try:
+        import csv
+        import io
+
+        from backend.db import engine
+        if engine is None:
+            return False
+
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for m in mappings:
+            writer.writerow([
+                "" if m["run_id"] is None else m["run_id"],
+                m["event_type"],
+                _dumps(m["payload_json"]),
+            ])
+        buf.seek(0)
+
+        raw = engine.raw_connection()
+        try:
+            cur = raw.cursor()
+            cur.copy_expert(
+                "COPY events (run_id, event_type, payload_json) FROM STDIN WITH (FORMAT csv)",
+                buf,
+            )
+            raw.commit()
+            cur.close()
+            return True
+        finally:
+            raw.close()
+    except Exception:
+        return False
+
+
+def _commit_batch(batch: list[dict]) -> None:
+    """Insert a batch of event mappings in a single transaction."""
+    mappings = [item["db"] for item in batch if item["db"] is not None]
+    if not mappings or not _db_ok or _SessionLocal is None or _Event is None:
+        return
+    if len(mappings) >= _COPY_MIN_ROWS and _copy_batch(mappings):
+        return
     try:
         session = _SessionLocal()
         try:
-            count = session.query(_Event).filter(_Event.run_id == _current_run_id).count()
-            return count
+            session.bulk_insert_mappings(_Event, mappings)
+            session.commit()
         finally:
             session.close()
     except Exception:
-        return 0
+        # Never crash on DB write failure
+        pass
+
+
+def _drain_loop() -> None:
+    """Background consumer: drain the queue in batches, writing each batch
+    as one file append and (when enabled) one DB transaction."""
+    while True:
+        batch = [_event_queue.get()]
+        deadline = time.monotonic() + _BATCH_TIMEOUT
+        while len(batch) < _BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_event_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _write_lines(batch)
+        _commit_batch(batch)
+        for _ in batch:
+            _event_queue.task_done()
+
+
+@atexit.register
+def flush_audit_log() -> None:
+    """Block until every queued event has been written (file + DB).
+
+    Called by gold_agent at run end so event counts are accurate before
+    db_finish_run, and at interpreter exit so no events are dropped.
+    """
+    if _worker_started:
+        _event_queue.join()
 
 
 def log_action(
@@ -64,47 +232,38 @@ def log_action(
     details: dict | None = None,
     success: bool = True,
 ) -> str:
-    """Write one audit log entry to /Logs (JSON file) + DB. Returns filename."""
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
-
+    """Append one audit log entry to the /Logs JSONL + DB. Returns filename."""
     now = datetime.now(timezone.utc)
     log_id = uuid.uuid4().hex[:12]
-    filename = f"{now.strftime('%Y%m%d_%H%M%S')}_{log_id}.json"
 
     entry = {
         "id": log_id,
-        "timestamp": now.isoformat(),
+        # Fixed-width (zero-padded microseconds) so readers can compare
+        # timestamps lexically without parsing
+        "timestamp": now.isoformat(timespec="microseconds"),
         "server": server,
         "action": action,
         "details": details or {},
         "success": success,
     }
 
-    # 1. JSON file (always)
-    log_path = LOGS_DIR / filename
+    # Serialize once on the caller thread; the worker coalesces batches into
+    # one file append (and one DB transaction when the DB is configured).
+    db_mapping = None
+    if _db_ok and _SessionLocal is not None and _Event is not None:
+        db_mapping = {
+            "run_id": _current_run_id,
+            "event_type": f"{server}.{action}",
+            "payload_json": entry,
+        }
+
     try:
-        log_path.write_text(json.dumps(entry, indent=2, default=str), encoding="utf-8")
+        _ensure_worker()
+        # Never block the hot path: if the queue is full the event goes to
+        # stdout rather than stalling the caller
+        _event_queue.put_nowait({"line": _dumps_bytes(entry), "db": db_mapping})
     except Exception:
-        print(f"[AUDIT FALLBACK] {json.dumps(entry, default=str)}")
+        print(f"[AUDIT FALLBACK] {_dumps(entry)}")
+        return ""
 
-    # 2. Neon DB (if available)
-    if _db_ok and _SessionLocal is not None and _Event is not None:
-        try:
-            session = _SessionLocal()
-            try:
-                event_type = f"{server}.{action}"
-                payload = json.dumps(entry, default=str)
-                row = _Event(
-                    run_id=_current_run_id,
-                    event_type=event_type,
-                    payload_json=payload,
-                )
-                session.add(row)
-                session.commit()
-            finally:
-                session.close()
-        except Exception:
-            # Never crash on DB write failure
-            pass
-
-    return filename
+    return _current_log_name()
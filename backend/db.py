@@ -8,10 +8,12 @@ still runs but without DB persistence (graceful degradation).
 Exports: DATABASE_URL, engine, SessionLocal, Base, db_available.
 """
 
+import json
 import os
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 DATABASE_URL = os.getenv("DATABASE_URL", "")
 
@@ -20,9 +22,22 @@ Base = declarative_base()
 if DATABASE_URL:
     engine = create_engine(
         DATABASE_URL,
-        pool_pre_ping=True,
+        # pool_pre_ping cost a SELECT 1 per checkout — significant against
+        # serverless Postgres (Neon). Recycling below its ~300s idle timeout
+        # keeps connections fresh without the per-checkout round-trip; the
+        # batched audit writer reuses one connection per batch anyway.
+        poolclass=QueuePool,
         pool_size=5,
-        max_overflow=10,
+        max_overflow=5,
+        pool_recycle=280,
+        pool_pre_ping=False,
+        connect_args={
+            "application_name": "gold_agent",
+            "options": "-c statement_timeout=5000",
+        },
+        # JSONB columns receive plain dicts; default=str keeps odd payload
+        # values (datetimes, exceptions) from breaking the insert.
+        json_serializer=lambda obj: json.dumps(obj, default=str),
     )
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     db_available = True
@@ -7,7 +7,8 @@ Tables:
   - events     : audit trail events (FK -> agent_runs)
 """
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Text, DateTime
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Text, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
 from .db import Base
@@ -50,11 +51,18 @@ class AgentRun(Base):
 class Event(Base):
     __tablename__ = "events"
 
+    # Composite index covers run_id-filtered counts (index-only scan) and
+    # run timelines ordered by ts; its left prefix replaces the old
+    # standalone run_id index.
+    __table_args__ = (Index("ix_events_run_ts", "run_id", "ts"),)
+
     id = Column(Integer, primary_key=True, index=True)
-    run_id = Column(Integer, ForeignKey("agent_runs.id"), nullable=True, index=True)
+    run_id = Column(Integer, ForeignKey("agent_runs.id"), nullable=True)
     ts = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     event_type = Column(String(200), nullable=False, default="")
-    payload_json = Column(Text, nullable=False, default="{}")
+    # JSONB: Postgres stores the dict directly (queryable, GIN-indexable);
+    # no Python-side json.dumps needed on insert.
+    payload_json = Column(JSONB, nullable=False, server_default="{}")
 
     def __repr__(self) -> str:
         return f"<Event id={self.id} run_id={self.run_id} type={self.event_type!r}>"
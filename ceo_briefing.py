@@ -17,7 +17,7 @@ from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from audit_logger import log_action
 from mcp_file_ops import list_tasks, read_task, write_task
-from mcp_audit_ops import get_action_summary, get_error_log
+from mcp_audit_ops import get_action_summary, get_error_log, get_recent_actions
 from mcp_calendar_ops import get_current_week
 from domain_router import get_all_domain_tasks
 
@@ -52,8 +52,9 @@ def generate_briefing() -> str:
     week = get_current_week()
     completed_count, completed_files = count_completed_this_week()
     domain_tasks = get_all_domain_tasks(BASE_DIR)
-    audit_summary = get_action_summary(hours=168)  # 7 days
-    errors = get_error_log(hours=168)
+    recent_actions = get_recent_actions(hours=168)  # 7 days, scanned once
+    audit_summary = get_action_summary(hours=168, actions=recent_actions)
+    errors = get_error_log(hours=168, actions=recent_actions)
 
     # Build task summaries
     task_summaries = []
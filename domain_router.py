@@ -7,6 +7,8 @@ Reads task content and routes to the appropriate domain folder
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
 from pathlib import Path
 from audit_logger import log_action
@@ -28,25 +30,78 @@ PERSONAL_KEYWORDS = [
     "shopping", "health", "fitness", "pet", "home", "garden",
 ]
 
+# Compiled once; IGNORECASE means no lowercased copy is needed for the
+# header check (keyword scoring still lowercases, but only on fallthrough).
+_DOMAIN_HEADER_RE = re.compile(r"domain:\s*(business|personal)", re.IGNORECASE)
+
+# Optional Aho-Corasick automaton: scans the text once for every keyword
+# instead of one substring search per keyword (~50 passes otherwise).
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # type: ignore
+
+_KEYWORD_AUTOMATON = None
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw in BUSINESS_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_kw, ("b", _kw))
+    for _kw in PERSONAL_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_kw, ("p", _kw))
+    _KEYWORD_AUTOMATON.make_automaton()
+
+
+def _keyword_scores(text: str) -> tuple[int, int]:
+    """Count distinct business/personal keywords present in text."""
+    if _KEYWORD_AUTOMATON is not None:
+        found_biz: set[str] = set()
+        found_per: set[str] = set()
+        for _, (tag, kw) in _KEYWORD_AUTOMATON.iter(text):
+            (found_biz if tag == "b" else found_per).add(kw)
+        return len(found_biz), len(found_per)
+    biz = sum(1 for kw in BUSINESS_KEYWORDS if kw in text)
+    per = sum(1 for kw in PERSONAL_KEYWORDS if kw in text)
+    return biz, per
+
+
+# Bounded result cache keyed by content hash: retries and the
+# process->route double classification hit the same content repeatedly.
+_CLASSIFY_CACHE: dict[bytes, str] = {}
+_CLASSIFY_CACHE_MAX = 1024
+
 
 def classify_task(content: str) -> str:
     """Classify task content as 'business' or 'personal'.
 
-    Uses keyword matching + domain header detection.
+    Uses keyword matching + domain header detection; results are cached
+    by content hash so retries skip the re-scan.
     Returns 'business' or 'personal'.
     """
-    text = content.lower()
+    key = hashlib.blake2b(content.encode("utf-8", "ignore"), digest_size=8).digest()
+    cached = _CLASSIFY_CACHE.get(key)
+    if cached is not None:
+        # Cached decisions still go to the audit trail — only the scan is skipped
+        log_action(SERVER_NAME, "classify_task", {"method": "cache", "domain": cached})
+        return cached
+    domain = _classify_impl(content)
+    if len(_CLASSIFY_CACHE) >= _CLASSIFY_CACHE_MAX:
+        _CLASSIFY_CACHE.clear()
+    _CLASSIFY_CACHE[key] = domain
+    return domain
+
 
+def _classify_impl(content: str) -> str:
+    """Uncached classification (header check, then keyword scoring)."""
     # Check for explicit domain header
-    domain_match = re.search(r"domain:\s*(business|personal)", text)
+    domain_match = _DOMAIN_HEADER_RE.search(content)
     if domain_match:
-        domain = domain_match.group(1)
+        domain = domain_match.group(1).lower()
         log_action(SERVER_NAME, "classify_task", {"method": "header", "domain": domain})
         return domain
 
     # Keyword scoring
-    biz_score = sum(1 for kw in BUSINESS_KEYWORDS if kw in text)
-    per_score = sum(1 for kw in PERSONAL_KEYWORDS if kw in text)
+    text = content.lower()
+    biz_score, per_score = _keyword_scores(text)
 
     if biz_score > per_score:
         domain = "business"
@@ -65,10 +120,15 @@ def classify_task(content: str) -> str:
     return domain
 
 
-def route_task(task_name: str, content: str, base_dir: str | Path) -> Path:
-    """Classify and return the appropriate domain subfolder path."""
+def route_task(task_name: str, content: str, base_dir: str | Path, domain: str | None = None) -> Path:
+    """Classify and return the appropriate domain subfolder path.
+
+    Callers that already classified the content can pass `domain` to skip
+    re-classification entirely.
+    """
     base_dir = Path(base_dir)
-    domain = classify_task(content)
+    if domain is None:
+        domain = classify_task(content)
 
     if domain == "business":
         target = base_dir / "Business"
@@ -80,18 +140,31 @@ def route_task(task_name: str, content: str, base_dir: str | Path) -> Path:
     return target
 
 
+def _list_md(directory: Path) -> list[str]:
+    """Sorted *.md filenames in directory via os.scandir (no per-entry stat).
+
+    Hidden files are skipped; a missing directory yields an empty list.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return sorted(
+                e.name
+                for e in it
+                if e.name.endswith(".md")
+                and not e.name.startswith(".")
+                and e.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
+        return []
+
+
 def get_all_domain_tasks(base_dir: str | Path) -> dict[str, list[str]]:
     """Return all tasks grouped by domain."""
     base_dir = Path(base_dir)
-    result = {"business": [], "personal": []}
-
-    biz_dir = base_dir / "Business"
-    per_dir = base_dir / "Personal"
-
-    if biz_dir.is_dir():
-        result["business"] = sorted(f.name for f in biz_dir.glob("*.md") if f.name != ".gitkeep")
-    if per_dir.is_dir():
-        result["personal"] = sorted(f.name for f in per_dir.glob("*.md") if f.name != ".gitkeep")
+    result = {
+        "business": _list_md(base_dir / "Business"),
+        "personal": _list_md(base_dir / "Personal"),
+    }
 
     log_action(SERVER_NAME, "get_all_domain_tasks", {
         "business_count": len(result["business"]),
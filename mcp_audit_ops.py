@@ -2,83 +2,298 @@
 MCP Server 4 – Audit & Compliance Operations.
 
 Provides audit trail queries, compliance checks, and reporting.
-Reads from /Logs JSON files for Gold tier accountability.
+Reads from /Logs for Gold tier accountability: the daily append-only
+run_*.jsonl logs plus legacy per-event *.json files.
 """
 
 from __future__ import annotations
 
-import json
+import bisect
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from audit_logger import log_action
+from utils.jsonio import loads as _loads
+
+try:
+    import ijson  # streaming parser; optional
+except ImportError:
+    ijson = None  # type: ignore
 
 SERVER_NAME = "mcp_audit_ops"
 BASE_DIR = Path(__file__).resolve().parent
 LOGS_DIR = BASE_DIR / "Logs"
 
+# Parsed log entries keyed by path; the value holds the (st_mtime_ns,
+# st_size) signature they were parsed under plus the raw ISO timestamp
+# (UTC ISO-8601 is lexicographically ordered, so the window filter is a
+# plain string compare — no datetime construction per entry). Repeat
+# queries only stat each file and re-parse the ones whose signature
+# changed.
+_PARSE_CACHE: dict[str, tuple[tuple[int, int], dict | None, str | None]] = {}
 
-def get_recent_actions(hours: int = 24) -> list[dict]:
-    """Return all audit log entries from the last N hours."""
+
+def _parse_log_file(path: str) -> tuple[dict | None, str | None]:
+    """Parse one log file; (None, None) for unreadable/non-dict entries."""
+    try:
+        # orjson (via the shim) decodes bytes directly — no UTF-8 decode pass
+        data = _loads(Path(path).read_bytes())
+        if not isinstance(data, dict):
+            return None, None  # skip daily array logs (vault_logger format)
+        return data, data.get("timestamp") or None
+    except (ValueError, OSError):
+        return None, None
+
+
+def _load_entry(path: str, cutoff_str: str) -> tuple[dict | None, str | None]:
+    """Load one log file, materializing the full dict only when in-window.
+
+    With ijson installed, only the top-level timestamp is streamed out of
+    the file; entries older than cutoff are never fully parsed. Falls back
+    to a plain full parse otherwise.
+    """
+    if ijson is None:
+        return _parse_log_file(path)
+    try:
+        ts = None
+        with open(path, "rb") as f:
+            for key, value in ijson.kvitems(f, ""):
+                if key == "timestamp":
+                    ts = str(value)
+                    break
+        if not ts:
+            return None, None
+        if ts < cutoff_str:
+            return None, ts  # out of window: skip the full parse
+        return _parse_log_file(path)
+    except Exception:
+        return _parse_log_file(path)
+
+
+def _has_ts_prefix(name: str) -> bool:
+    """True for the audit logger's YYYYMMDD_HHMMSS_<id>.json naming."""
+    return (
+        len(name) > 15
+        and name[:8].isdigit()
+        and name[8] == "_"
+        and name[9:15].isdigit()
+    )
+
+
+def _iter_jsonl_entries(cutoff: datetime):
+    """Yield parsed entries from daily run_*.jsonl logs overlapping the window.
+
+    One streaming pass per file (buffered line iteration happens in C);
+    files whose date component is older than the cutoff day are skipped
+    without being opened.
+    """
+    cutoff_day = cutoff.strftime("%Y%m%d")
+    try:
+        with os.scandir(LOGS_DIR) as it:
+            paths = sorted(
+                e.path
+                for e in it
+                if e.name.startswith("run_")
+                and e.name.endswith(".jsonl")
+                and e.name[4:12] >= cutoff_day
+            )
+    except FileNotFoundError:
+        return
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                for line in f:
+                    try:
+                        data = _loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(data, dict):
+                        yield data
+        except OSError:
+            continue
+
+
+def _iter_recent(hours: int):
+    """Yield in-window audit entries: legacy per-event files, then JSONL.
+
+    One shared scan pipeline behind get_recent_actions, get_error_log and
+    get_action_summary — consumers that only aggregate never hold the full
+    entry list in memory.
+    """
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-    entries = []
+    cutoff_str = cutoff.isoformat(timespec="microseconds")
+    cutoff_ns = int(cutoff.timestamp() * 1_000_000_000)
+
+    try:
+        with os.scandir(LOGS_DIR) as it:
+            files = sorted((e for e in it if e.name.endswith(".json")), key=lambda e: e.name)
+    except FileNotFoundError:
+        return
 
-    if not LOGS_DIR.is_dir():
-        return entries
+    # Filenames carry a sortable UTC timestamp prefix, so a binary search
+    # finds the first possibly-in-window file — files before it are
+    # rejected by name with zero opens. Odd-named files keep the slow path.
+    cutoff_prefix = cutoff.strftime("%Y%m%d_%H%M%S")
+    prefixed = [e for e in files if _has_ts_prefix(e.name)]
+    others = [e for e in files if not _has_ts_prefix(e.name)]
+    names = [e.name for e in prefixed]
+    idx = bisect.bisect_left(names, cutoff_prefix)
+    files = prefixed[idx:] + others
 
-    for log_file in sorted(LOGS_DIR.glob("*.json")):
+    seen = set()
+    resolved: dict[str, tuple[dict | None, str | None]] = {}
+    misses: list[tuple[str, tuple[int, int], bool]] = []
+
+    for log_file in files:
         try:
-            data = json.loads(log_file.read_text(encoding="utf-8"))
-            if not isinstance(data, dict):
-                continue  # skip daily array logs (vault_logger format)
-            ts = datetime.fromisoformat(data.get("timestamp", ""))
-            if ts >= cutoff:
-                entries.append(data)
-        except (json.JSONDecodeError, ValueError, OSError):
+            stat = log_file.stat()
+        except OSError:
+            continue
+        seen.add(log_file.path)
+        # A log file is written once, right after its entry's timestamp;
+        # an mtime before the window means the entry can't be in it
+        if stat.st_mtime_ns < cutoff_ns:
             continue
+        sig = (stat.st_mtime_ns, stat.st_size)
+
+        cached = _PARSE_CACHE.get(log_file.path)
+        if cached is not None and cached[0] == sig:
+            data, ts = cached[1], cached[2]
+            if data is None and ts is not None and ts >= cutoff_str:
+                # Cached as out-of-window under a narrower query; parse now
+                misses.append((log_file.path, sig, True))
+            else:
+                resolved[log_file.path] = (data, ts)
+        else:
+            misses.append((log_file.path, sig, False))
+
+    # Each miss is an independent read+decode; fan out across threads
+    # (read_text releases the GIL for the I/O part)
+    if misses:
+        def _resolve(item: tuple[str, tuple[int, int], bool]):
+            path, sig, full_parse = item
+            data, ts = _parse_log_file(path) if full_parse else _load_entry(path, cutoff_str)
+            return path, sig, data, ts
+
+        if len(misses) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(misses))) as executor:
+                loaded = list(executor.map(_resolve, misses))
+        else:
+            loaded = [_resolve(misses[0])]
+        for path, sig, data, ts in loaded:
+            _PARSE_CACHE[path] = (sig, data, ts)
+            resolved[path] = (data, ts)
+
+    # Evict cache entries whose file disappeared
+    for path in list(_PARSE_CACHE):
+        if path not in seen:
+            del _PARSE_CACHE[path]
+
+    for log_file in files:
+        data, ts = resolved.get(log_file.path, (None, None))
+        if data is not None and ts is not None and ts >= cutoff_str:
+            yield data
+
+    # Current-format events live in the daily JSONL logs
+    for data in _iter_jsonl_entries(cutoff):
+        if data.get("timestamp", "") >= cutoff_str:
+            yield data
+
 
+def get_recent_actions(hours: int = 24) -> list[dict]:
+    """Return all audit log entries from the last N hours."""
+    entries = list(_iter_recent(hours))
     log_action(SERVER_NAME, "get_recent_actions", {"hours": hours, "count": len(entries)})
     return entries
 
 
-def get_error_log(hours: int = 24) -> list[dict]:
-    """Return failed actions from the last N hours."""
-    all_actions = get_recent_actions(hours)
-    errors = [a for a in all_actions if not a.get("success", True)]
+def get_error_log(hours: int = 24, actions: list[dict] | None = None) -> list[dict]:
+    """Return failed actions from the last N hours.
+
+    Pass a pre-fetched `actions` list to reuse one get_recent_actions scan
+    across multiple report calls.
+    """
+    if actions is None:
+        actions = _iter_recent(hours)
+    errors = [a for a in actions if not a.get("success", True)]
     return errors
 
 
-def get_action_summary(hours: int = 24) -> dict:
-    """Return summary counts of actions by server and type."""
-    actions = get_recent_actions(hours)
-    summary: dict[str, int] = {}
+def get_action_summary(hours: int = 24, actions: list[dict] | None = None) -> dict:
+    """Return summary counts of actions by server and type.
 
+    Pass a pre-fetched `actions` list to reuse one get_recent_actions scan
+    across multiple report calls.
+    """
+    if actions is None:
+        actions = _iter_recent(hours)
+    # Single streaming pass: totals, breakdown and errors come out of one
+    # iteration, so a generator input is never materialized into a list
+    breakdown: Counter[str] = Counter()
+    errors = 0
+    total = 0
     for action in actions:
-        server = action.get("server", "unknown")
-        action_type = action.get("action", "unknown")
-        key = f"{server}.{action_type}"
-        summary[key] = summary.get(key, 0) + 1
+        total += 1
+        breakdown[f"{action.get('server', 'unknown')}.{action.get('action', 'unknown')}"] += 1
+        errors += not action.get("success", True)
 
     result = {
-        "total_actions": len(actions),
-        "breakdown": summary,
-        "errors": sum(1 for a in actions if not a.get("success", True)),
+        "total_actions": total,
+        "breakdown": dict(breakdown),
+        "errors": errors,
     }
     log_action(SERVER_NAME, "get_action_summary", {"hours": hours})
     return result
 
 
+# Last compliance result keyed by the filesystem state it was computed
+# from; a repeat call with nothing changed costs a handful of stats and
+# no .gitignore read.
+_COMPLIANCE_CACHE: tuple[tuple, dict] | None = None
+
+
 def compliance_check() -> dict:
     """Run a compliance check on the vault state."""
+    global _COMPLIANCE_CACHE
     base = Path(__file__).resolve().parent
+    gitignore = base / ".gitignore"
+    try:
+        gitignore_mtime = gitignore.stat().st_mtime_ns
+    except OSError:
+        gitignore_mtime = None
+
+    key = (
+        gitignore_mtime,
+        (base / ".env").exists(),
+        LOGS_DIR.is_dir(),
+        (base / "credentials.json").exists(),
+        (base / "token.json").exists(),
+    )
+    if _COMPLIANCE_CACHE is not None and _COMPLIANCE_CACHE[0] == key:
+        checks = dict(_COMPLIANCE_CACHE[1])
+        log_action(SERVER_NAME, "compliance_check", checks)
+        return checks
+
+    # Line-exact check: the old substring test also matched ".environments"
+    env_ignored = False
+    if gitignore_mtime is not None:
+        try:
+            lines = gitignore.read_text(encoding="utf-8").splitlines()
+            env_ignored = ".env" in (line.strip() for line in lines)
+        except OSError:
+            pass
+
     checks = {
-        "env_file_not_tracked": not (base / ".env").exists() or ".env" in (base / ".gitignore").read_text(),
-        "logs_dir_exists": LOGS_DIR.is_dir(),
-        "gitignore_exists": (base / ".gitignore").exists(),
-        "no_credentials_in_repo": not (base / "credentials.json").exists(),
-        "no_token_in_repo": not (base / "token.json").exists(),
+        "env_file_not_tracked": not key[1] or env_ignored,
+        "logs_dir_exists": key[2],
+        "gitignore_exists": gitignore_mtime is not None,
+        "no_credentials_in_repo": not key[3],
+        "no_token_in_repo": not key[4],
     }
-    all_pass = all(checks.values())
-    checks["all_pass"] = all_pass
+    checks["all_pass"] = all(checks.values())
+    _COMPLIANCE_CACHE = (key, dict(checks))
     log_action(SERVER_NAME, "compliance_check", checks)
     return checks
 
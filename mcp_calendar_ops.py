@@ -9,15 +9,26 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from audit_logger import log_action
 
 SERVER_NAME = "mcp_calendar_ops"
 
 
+# The week summary only changes at midnight UTC; cache it per day so
+# repeat calls within a run skip the five strftime passes
+_WEEK_CACHE: tuple[int, dict] | None = None
+
+
 def get_current_week() -> dict:
     """Return current week boundaries (Monday-Sunday) in UTC."""
+    global _WEEK_CACHE
     now = datetime.now(timezone.utc)
+    day = now.toordinal()
+    if _WEEK_CACHE is not None and _WEEK_CACHE[0] == day:
+        result = dict(_WEEK_CACHE[1])
+        log_action(SERVER_NAME, "get_current_week", result)
+        return result
     monday = now - timedelta(days=now.weekday())
     sunday = monday + timedelta(days=6)
     result = {
@@ -27,6 +38,7 @@ def get_current_week() -> dict:
         "current_date": now.strftime("%Y-%m-%d"),
         "iso_week": now.isocalendar()[1],
     }
+    _WEEK_CACHE = (day, dict(result))
     log_action(SERVER_NAME, "get_current_week", result)
     return result
 
@@ -36,23 +48,32 @@ def is_briefing_due(last_briefing_date: str | None = None) -> bool:
     if not last_briefing_date:
         return True
     try:
-        last = datetime.strptime(last_briefing_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        now = datetime.now(timezone.utc)
-        due = (now - last).days >= 7
+        # Fixed YYYY-MM-DD layout: three int() slices beat strptime's
+        # format-string interpreter by an order of magnitude
+        s = last_briefing_date
+        last = date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+        today = datetime.now(timezone.utc).date()
+        due = (today - last).days >= 7
         log_action(SERVER_NAME, "is_briefing_due", {"last": last_briefing_date, "due": due})
         return due
-    except ValueError:
-        return True
+    except (ValueError, IndexError):
+        return True  # unparseable date fails toward briefing
 
 
-def prioritize_tasks(tasks: list[dict]) -> list[dict]:
-    """Sort tasks by priority: urgent > business > personal > low."""
-    priority_map = {"urgent": 0, "business": 1, "personal": 2, "low": 3}
+_PRIORITY_MAP = {"urgent": 0, "business": 1, "personal": 2, "low": 3}
 
-    def sort_key(task: dict) -> int:
-        return priority_map.get(task.get("priority", "low"), 3)
 
-    sorted_tasks = sorted(tasks, key=sort_key)
+def prioritize_tasks(tasks: list[dict]) -> list[dict]:
+    """Sort tasks by priority: urgent > business > personal > low."""
+    # Decorate-sort-undecorate: one O(n) pass of dict lookups, then a sort
+    # over int keys (the index tiebreaker keeps it stable and keeps the
+    # comparison from ever touching the dicts)
+    keyed = [
+        (_PRIORITY_MAP.get(task.get("priority", "low"), 3), i, task)
+        for i, task in enumerate(tasks)
+    ]
+    keyed.sort()
+    sorted_tasks = [task for _, _, task in keyed]
     log_action(SERVER_NAME, "prioritize_tasks", {"count": len(tasks)})
     return sorted_tasks
 
@@ -7,7 +7,10 @@ Used by the Gold agent for cross-domain file management.
 
 from __future__ import annotations
 
+import errno
+import os
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from audit_logger import log_action
 
@@ -15,20 +18,41 @@ SERVER_NAME = "mcp_file_ops"
 
 
 def list_tasks(folder: str | Path, extension: str = "*.md") -> list[str]:
-    """Return sorted list of task filenames in folder (excluding .gitkeep)."""
+    """Return sorted list of task filenames in folder (excluding .gitkeep).
+
+    `extension` may be a glob like "*.md" or a plain suffix like ".md".
+    """
     folder = Path(folder)
-    if not folder.is_dir():
+    # os.scandir + endswith: one syscall per dirent, no per-entry stat and
+    # no fnmatch, unlike Path.glob
+    suffix = extension.lstrip("*")
+    try:
+        with os.scandir(folder) as it:
+            results = sorted(
+                e.name for e in it if e.name.endswith(suffix) and e.name != ".gitkeep"
+            )
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    results = sorted(f.name for f in folder.glob(extension) if f.name != ".gitkeep")
     log_action(SERVER_NAME, "list_tasks", {"folder": str(folder), "count": len(results)})
     return results
 
 
+@lru_cache(maxsize=512)
+def _read_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read + decode keyed by the file's stat signature.
+
+    A file re-read with an unchanged (mtime_ns, size) comes straight from
+    the cache; any modification changes the key and forces a fresh read.
+    """
+    return Path(path_str).read_text(encoding="utf-8", errors="ignore").strip()
+
+
 def read_task(file_path: str | Path) -> str:
     """Read and return file contents. Returns empty string on failure."""
     file_path = Path(file_path)
     try:
-        content = file_path.read_text(encoding="utf-8", errors="ignore").strip()
+        stat = file_path.stat()
+        content = _read_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
         log_action(SERVER_NAME, "read_task", {"file": str(file_path), "chars": len(content)})
         return content
     except Exception as e:
@@ -41,7 +65,9 @@ def write_task(file_path: str | Path, content: str) -> bool:
     file_path = Path(file_path)
     try:
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding="utf-8")
+        # One encode + one unbuffered write; skips the TextIOWrapper copy
+        with open(file_path, "wb", buffering=0) as f:
+            f.write(content.encode("utf-8"))
         log_action(SERVER_NAME, "write_task", {"file": str(file_path), "chars": len(content)})
         return True
     except Exception as e:
@@ -57,7 +83,14 @@ def move_task(src: str | Path, dst: str | Path) -> bool:
         return False
     try:
         dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(src), str(dst))
+        # rename(2) is a single atomic syscall; shutil.move only as the
+        # cross-filesystem fallback (copy + unlink)
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(src), str(dst))
         log_action(SERVER_NAME, "move_task", {"src": str(src), "dst": str(dst)})
         return True
     except Exception as e:
@@ -2,7 +2,7 @@
 """
 run_daily_audit.py — Daily Audit Runner (cron-safe)
 
-Reads all Logs/*.json files, produces:
+Reads all Logs/*.json files plus the daily run_*.jsonl logs, produces:
   Business/Reports/DAILY_AUDIT_<date>.md   — human-readable markdown report
   Evidence/DAILY_AUDIT_<date>.json         — machine-readable evidence snapshot
 
@@ -34,7 +34,11 @@ EVIDENCE_DIR = os.path.join(ROOT, "Evidence")
 
 
 def load_logs() -> list[dict]:
-    """Load all JSON log entries from Logs/*.json (skips malformed files)."""
+    """Load all log entries from Logs/ (skips malformed files).
+
+    Reads both the legacy per-event *.json files and the daily append-only
+    run_*.jsonl logs that the audit logger writes now.
+    """
     entries = []
     for path in sorted(glob.glob(os.path.join(LOGS_DIR, "*.json"))):
         try:
@@ -45,6 +49,21 @@ def load_logs() -> list[dict]:
         except Exception:
             # Cron-safe: skip unreadable / malformed files silently
             pass
+    for path in sorted(glob.glob(os.path.join(LOGS_DIR, "run_*.jsonl"))):
+        source = os.path.basename(path)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        data = json.loads(line)
+                    except Exception:
+                        continue
+                    if isinstance(data, dict):
+                        data["_source_file"] = source
+                        entries.append(data)
+        except Exception:
+            # Cron-safe: skip unreadable / malformed files silently
+            pass
     return entries
 
 
@@ -106,7 +125,7 @@ def render_markdown(date_str: str, stats: dict, generated_at: str) -> str:
         f"# Daily Audit Report — {date_str}",
         "",
         f"> Generated: {generated_at}  ",
-        f"> Source: `Logs/*.json`",
+        f"> Source: `Logs/*.json` + `Logs/run_*.jsonl`",
         "",
         "---",
         "",
@@ -6,7 +6,7 @@ MCP Health Report — Gold Tier Diagnostic Tool
 Outputs:
   - Registered MCP tools (from Evidence/REGISTERED_MCP_TOOLS.json)
   - MCP_DRY_RUN environment value
-  - Last log timestamp (from Logs/*.json)
+  - Last log timestamp (from Logs/*.json and Logs/run_*.jsonl)
   - Writes Evidence/MCP_HEALTH_REPORT.json
 """
 
@@ -52,21 +52,39 @@ def _get_dry_run_value() -> str:
     return raw.strip().lower()
 
 
+def _last_jsonl_entry(log_file: Path) -> dict | None:
+    """Return the last parseable entry of an append-only run_*.jsonl log."""
+    last: dict | None = None
+    with open(log_file, "r", encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                data = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(data, dict):
+                last = data
+    return last
+
+
 def _get_last_log_timestamp() -> str | None:
-    """Return ISO timestamp of the most-recently-written Logs/*.json entry."""
+    """Return ISO timestamp of the most-recently-written Logs entry."""
     if not LOGS_DIR.is_dir():
         return None
 
     latest_ts: str | None = None
     latest_mtime: float = 0.0
 
-    for log_file in LOGS_DIR.glob("*.json"):
+    log_files = list(LOGS_DIR.glob("*.json")) + list(LOGS_DIR.glob("run_*.jsonl"))
+    for log_file in log_files:
         mtime = log_file.stat().st_mtime
         if mtime > latest_mtime:
             latest_mtime = mtime
             # Try to read the timestamp field from the JSON itself
             try:
-                data = json.loads(log_file.read_text(encoding="utf-8"))
+                if log_file.suffix == ".jsonl":
+                    data = _last_jsonl_entry(log_file)
+                else:
+                    data = json.loads(log_file.read_text(encoding="utf-8"))
                 if isinstance(data, dict) and "timestamp" in data:
                     latest_ts = data["timestamp"]
                 elif isinstance(data, list) and data and "timestamp" in data[-1]:
@@ -94,6 +112,19 @@ def _count_logs_by_server() -> dict[str, int]:
                 counts[server] = counts.get(server, 0) + 1
         except Exception:
             pass
+    for log_file in LOGS_DIR.glob("run_*.jsonl"):
+        try:
+            with open(log_file, "r", encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        entry = json.loads(line)
+                    except Exception:
+                        continue
+                    if isinstance(entry, dict):
+                        server = entry.get("server", "unknown")
+                        counts[server] = counts.get(server, 0) + 1
+        except Exception:
+            pass
     return dict(sorted(counts.items(), key=lambda x: x[1], reverse=True))
 
 
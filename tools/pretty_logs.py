@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+tools/pretty_logs.py — Pretty-print compact audit JSONL logs for humans.
+
+The audit logger writes compact single-line JSON (no indent) to keep
+bytes on disk and over the wire small; this helper re-indents entries
+on demand for debugging.
+
+Usage
+-----
+    python tools/pretty_logs.py                 # today's log
+    python tools/pretty_logs.py Logs/run_20260827.jsonl
+    python tools/pretty_logs.py --last 20       # only the last N entries
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+LOGS_DIR = BASE_DIR / "Logs"
+
+
+def default_log() -> Path:
+    return LOGS_DIR / f"run_{datetime.now(timezone.utc).strftime('%Y%m%d')}.jsonl"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pretty-print audit JSONL logs.")
+    parser.add_argument("path", nargs="?", default=None, help="JSONL file (default: today's)")
+    parser.add_argument("--last", type=int, default=0, help="only show the last N entries")
+    args = parser.parse_args()
+
+    path = Path(args.path) if args.path else default_log()
+    if not path.is_file():
+        print(f"No such log file: {path}", file=sys.stderr)
+        return 1
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    if args.last:
+        lines = lines[-args.last:]
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            print(json.dumps(json.loads(line), indent=2, default=str))
+        except json.JSONDecodeError:
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
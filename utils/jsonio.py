@@ -0,0 +1,41 @@
+"""
+utils/jsonio.py — JSON encode/decode via orjson with a stdlib fallback.
+
+orjson (yyjson-based, SIMD structural scan) decodes bytes directly and
+emits bytes, skipping a UTF-8 round-trip on both sides. Every helper
+degrades to stdlib json when orjson is not installed.
+
+Decode errors raise ValueError subclasses from either backend, so
+callers can catch ValueError regardless of which one is active.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def loads(data: bytes | str):
+    """Decode JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj, default=str) -> bytes:
+    """Encode obj to compact JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default)
+        except Exception:
+            pass
+    return json.dumps(obj, default=default).encode("utf-8")
+
+
+def dumps(obj, default=str) -> str:
+    """Encode obj to a compact JSON string."""
+    return dumps_bytes(obj, default=default).decode("utf-8")